@@ -4,10 +4,8 @@
 # In[1]:
 
 
-import os, warnings
+import warnings
 warnings.simplefilter('ignore')
-import ipyleaflet
-import time
 
 
 import ee
@@ -18,18 +16,7 @@ wxee.Initialize()
 import geemap
 
 
-import requests
-import boto3
-from google.cloud import storage
-
-import pandas as pd
-import numpy as np
-import rasterio
-from rasterio import features
 import geopandas as gpd
-import xarray as xr
-from xrspatial import zonal_stats
-import glob
 
 
 # In[2]:
@@ -4,7 +4,7 @@
 # In[1]:
 
 
-import os, warnings
+import warnings
 warnings.simplefilter('ignore')
 
 import osmnx as ox
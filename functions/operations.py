@@ -4,12 +4,10 @@
 # In[ ]:
 
 
-import os, warnings
+import warnings
 warnings.simplefilter('ignore')
 
 import geopandas as gpd
-import pandas as pd
-import numpy as np
 import xarray as xr
 from xrspatial import zonal_stats
 from rasterio import features
@@ -26,7 +24,6 @@ def calculate_zonalstats(boundary_path, tifffile_path, variable = 'band_data'):
     variable: varaible name in xarray dataset for which zonal statistics is to be computed. Default is "band_data"
     '''
     gdf = gpd.read_file(boundary_path)
-    xr_ds = xr.open_dataset(tifffile_path)
     
     gdf = gdf.reset_index()
     zones_gdf = gdf[['geometry', 'index']]
@@ -34,13 +31,16 @@ def calculate_zonalstats(boundary_path, tifffile_path, variable = 'band_data'):
     zones_gdf['index'] = zones_gdf['index'] + 1
     geom = zones_gdf[['geometry', 'index']].values.tolist()
 
-    zones_gdf_rasterized = features.rasterize(geom, out_shape=[xr_ds.dims['y'],xr_ds.dims['x']], transform=xr_ds.rio.transform())
+    # close the file handle once the stats are computed
+    with xr.open_dataset(tifffile_path) as xr_ds:
+        zones_gdf_rasterized = features.rasterize(geom, out_shape=[xr_ds.dims['y'],xr_ds.dims['x']], transform=xr_ds.rio.transform())
 
-    zones_gdf_rasterized_xarr = xr_ds.squeeze().copy()
+        values_xarr = xr_ds.squeeze()[variable]
 
-    zones_gdf_rasterized_xarr['zone'] = (('y', 'x'), zones_gdf_rasterized)
-    
-    zs = zonal_stats(zones_gdf_rasterized_xarr['zone'], xr_ds.squeeze()[variable])
+        # attach the zones to the band's coords
+        zones_gdf_rasterized_xarr = values_xarr.copy(deep = False, data = zones_gdf_rasterized)
+
+        zs = zonal_stats(zones_gdf_rasterized_xarr, values_xarr)
     
     zs = zs[zs['zone'] != 0]
     
@@ -4,20 +4,14 @@
 # In[1]:
 
 
-import os, warnings
+import warnings
 warnings.simplefilter('ignore')
 
 import geopandas as gpd
 import pandas as pd
-import numpy as np
 import xarray as xr
 from rasterio import features
 
-import geemap
-import ee
-#ee.Initialize()
-import leafmap
-
 
 # In[2]:
 
@@ -32,7 +26,6 @@ def plot_boxplot(boundary_path, tifffile_path, figdims = None, variable = 'band_
     '''
     
     gdf = gpd.read_file(boundary_path)
-    xr_ds = xr.open_dataset(tifffile_path)
     
     gdf = gdf.reset_index()
     zones_gdf = gdf[['geometry', 'index']]
@@ -40,15 +33,15 @@ def plot_boxplot(boundary_path, tifffile_path, figdims = None, variable = 'band_
     zones_gdf['index'] = zones_gdf['index'] + 1
     geom = zones_gdf[['geometry', 'index']].values.tolist()
 
-    zones_gdf_rasterized = features.rasterize(geom, out_shape=[xr_ds.dims['y'],xr_ds.dims['x']], transform=xr_ds.rio.transform())
+    # close the file handle once the values are in memory
+    with xr.open_dataset(tifffile_path) as xr_ds:
+        zones_gdf_rasterized = features.rasterize(geom, out_shape=[xr_ds.dims['y'],xr_ds.dims['x']], transform=xr_ds.rio.transform())
 
-    zones_gdf_rasterized_xarr = xr_ds.squeeze().copy()
+        # drop pixels outside every zone before building the frame
+        zones = zones_gdf_rasterized.ravel()
+        in_zone = zones != 0
 
-    zones_gdf_rasterized_xarr['zone'] = (('y', 'x'), zones_gdf_rasterized)
-    
-    df = pd.DataFrame({'value' : np.array(xr_ds['band_data']).ravel(), 'zone' : np.array(zones_gdf_rasterized_xarr['zone']).ravel()})
-    
-    df = df[df['zone'] != 0].reset_index(drop = True)
+        df = pd.DataFrame({'value' : xr_ds[variable].values.ravel()[in_zone], 'zone' : zones[in_zone]})
     
     box_plot = df.boxplot(by='zone', figsize = figdims)
     
@@ -67,6 +60,10 @@ def plot_ee_image(ee_img, boundary_path, minmax, palette, display_name):
     palette: Color palette to be used for plotting the raster. Takes a list as input coresposnding to min, max and intermidiate values
     display_name: Display name of the data
     '''
+    # map libraries are only needed here, keep them off the module import
+    import geemap
+    import ee
+    
     gdf = gpd.read_file(boundary_path)
     fc = ee.FeatureCollection(geemap.geopandas_to_ee(gdf))
     
@@ -92,6 +89,8 @@ def plot_ee_fc(boundary_path, zoom, display_name):
     zoom: Zoom level of POV
     display_name: Display name of the data
     '''
+    import leafmap
+    
     gdf = gpd.read_file(boundary_path).dissolve()
     cent = gdf.centroid
     